@@ -0,0 +1,34 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Compiled Haversine kernels used by main.py when available.
+
+Build in place with: cythonize -i fast_haversine.pyx
+(haversine_batch only runs its loop in parallel when compiled with OpenMP, e.g. -fopenmp)
+"""
+from cython.parallel cimport prange
+from libc.math cimport sin, cos, asin, sqrt, fmin, M_PI
+
+cdef double EARTH_RADIUS_KM = 6371.0
+cdef double DEG_TO_RAD = M_PI / 180.0
+
+
+cpdef double haversine(double lat1_rad, double lng1_rad, double cos_lat1,
+                       double lat2, double lng2) noexcept nogil:
+    """Haversine distance in km from a point given in radians (plus its cosine) to one in degrees."""
+    cdef double lat2_rad = lat2 * DEG_TO_RAD
+    cdef double sin_dlat = sin((lat2_rad - lat1_rad) / 2)
+    cdef double sin_dlon = sin((lng2 * DEG_TO_RAD - lng1_rad) / 2)
+    cdef double a = sin_dlat * sin_dlat + cos_lat1 * cos(lat2_rad) * sin_dlon * sin_dlon
+
+    # Clamp to guard asin against rounding just above 1 for antipodal points
+    return 2 * EARTH_RADIUS_KM * asin(sqrt(fmin(a, 1.0)))
+
+
+def haversine_batch(double lat1_rad, double lng1_rad, double cos_lat1,
+                    const double[:] lats, const double[:] lngs, double[:] out):
+    """Fill `out` with the distances from the origin to each (lats[i], lngs[i]) without holding the GIL."""
+    cdef Py_ssize_t i, n = lats.shape[0]
+    if lngs.shape[0] != n or out.shape[0] != n:
+        raise ValueError("lats, lngs and out must have the same length")
+
+    for i in prange(n, nogil=True):
+        out[i] = haversine(lat1_rad, lng1_rad, cos_lat1, lats[i], lngs[i])
@@ -1,36 +1,111 @@
-import requests
-from datetime import datetime, timezone, timedelta
+import httpx
+from datetime import datetime, timezone
 import smtplib
 import time
 import math
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import atexit
 from typing import Tuple, Optional
+from dataclasses import dataclass, field
 import os
+import sys
 from dotenv import load_dotenv
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from email.message import EmailMessage
+
+try:
+    import numpy as np
+except ImportError:  # Only needed for batch distance calculations
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # Fall back to plain Python for the distance kernel
+    njit = None
+
+try:
+    import h2
+except ImportError:  # httpx only speaks HTTP/2 with h2 installed (pip install "httpx[http2]")
+    h2 = None
 
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("iss_tracker.log"),
-        logging.StreamHandler()
-    ]
-)
+# Configure logging. Records go through a queue so file and console writes happen on a
+# background listener thread instead of blocking the polling loop
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_log_handlers = [logging.FileHandler("iss_tracker.log"), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.Queue(-1)
+LOG_LISTENER = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+LOG_LISTENER.start()
+atexit.register(LOG_LISTENER.stop)  # Flush whatever is still queued on exit
+
+logging.getLogger().setLevel(logging.INFO)
+logging.getLogger().addHandler(QueueHandler(_log_queue))
+logging.getLogger("httpx").setLevel(logging.WARNING)  # Its per-request INFO lines would flood the log
 
 # Configuration from environment variables
-MY_EMAIL = os.getenv("MY_EMAIL", "your_email@gmail.com")
-EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD", "your_app_password")
-MY_LAT = float(os.getenv("MY_LAT", "22.470493"))
-MY_LNG = float(os.getenv("MY_LNG", "88.307407"))
-TIMEZONE_OFFSET = float(os.getenv("TIMEZONE_OFFSET", "5.5"))  # Default to IST
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Settings read once at startup, plus the values derived from them."""
+    email: str
+    password: str = field(repr=False)  # Keep the app password out of logs and tracebacks
+    my_lat: float
+    my_lng: float
+    tz_offset: float
+    my_lat_rad: float = field(init=False)
+    my_lng_rad: float = field(init=False)
+    cos_my_lat: float = field(init=False)
+    utc_offset_seconds: float = field(init=False)
+    errors: Tuple[str, ...] = field(init=False)
+
+    def __post_init__(self):
+        # Frozen, so derived fields have to be set through object.__setattr__
+        object.__setattr__(self, "my_lat_rad", math.radians(self.my_lat))
+        object.__setattr__(self, "my_lng_rad", math.radians(self.my_lng))
+        object.__setattr__(self, "cos_my_lat", math.cos(self.my_lat_rad))
+        object.__setattr__(self, "utc_offset_seconds", self.tz_offset * 3600)
+        
+        errors = []
+        if self.email == "your_email@gmail.com":
+            errors.append("Please set your email address in the .env file")
+        if self.password == "your_app_password":
+            errors.append("Please set your email app password in the .env file")
+        if not (-90 <= self.my_lat <= 90):
+            errors.append(f"Invalid latitude: {self.my_lat}. Must be between -90 and 90")
+        if not (-180 <= self.my_lng <= 180):
+            errors.append(f"Invalid longitude: {self.my_lng}. Must be between -180 and 180")
+        object.__setattr__(self, "errors", tuple(errors))
+
+CFG = Config(
+    email=os.getenv("MY_EMAIL", "your_email@gmail.com"),
+    password=os.getenv("EMAIL_PASSWORD", "your_app_password"),
+    my_lat=float(os.getenv("MY_LAT", "22.470493")),
+    my_lng=float(os.getenv("MY_LNG", "88.307407")),
+    tz_offset=float(os.getenv("TIMEZONE_OFFSET", "5.5")),  # Default to IST
+)
+
+SECONDS_PER_DAY = 86400
+POLL_INTERVAL_SECONDS = 60.0
+PRE_SUNSET_BUFFER_SECONDS = 30 * 60  # Start polling the ISS this long before sunset
+EARTH_RADIUS_KM = 6371.0
+OVERHEAD_RADIUS_KM = 500.0  # ISS counts as overhead within this distance
+
+# Enable ANSI escape handling on Windows consoles
+if os.name == 'nt':
+    try:
+        import colorama
+        colorama.just_fix_windows_console()
+    except ImportError:
+        pass
 
 # Visual elements for console output
+CLEAR_SCREEN = "\x1b[H\x1b[2J"  # Cursor home, then erase the display
+
 BANNER = r"""
   _____ _____ ____    ____  _   _ ____  _     _____ 
  |_   _|  ___/ ___|  / ___|| | | |  _ \| |   | ____|
@@ -41,7 +116,40 @@ BANNER = r"""
 ✨ ISS TRACKER ACTIVATED ✨
 Monitoring your position: {}, {}
 Notification email: {}
-""".format(MY_LAT, MY_LNG, MY_EMAIL)
+""".format(CFG.my_lat, CFG.my_lng, CFG.email)
+
+# Shared HTTP client so the ISS and sunrise-sunset connections are kept alive between polls
+# (HTTP/2 is negotiated when h2 is installed and the server supports it). The pool is sized for the two hosts, and
+# idle sockets are kept longer than the poll interval so each tick reuses a warm connection
+CLIENT = httpx.Client(
+    http2=h2 is not None,
+    timeout=10.0,
+    headers={"User-Agent": "iss-tracker-cli"},
+    limits=httpx.Limits(max_connections=4, max_keepalive_connections=2, keepalive_expiry=75),
+)
+
+# Sunrise/sunset only change once a day, so keep the last answer for the whole local day.
+# It doubles as the stale-if-error fallback: when a fetch fails, the last times are reused
+_sun_cache = {"day": None, "sunrise": None, "sunset": None}
+
+# SMTP connection kept open between sightings so TLS and login happen only once
+_smtp: Optional[smtplib.SMTP] = None
+
+# Static pieces of each console frame, built once
+FRAME_HEADER = CLEAR_SCREEN + BANNER + "\n"
+DAYTIME_STATUS = "☀️  Daytime - ISS polling paused until shortly before sunset\n"
+STATUS_TEMPLATE = "\n🌙 Night time: {night}\n🛰️  ISS overhead: {overhead}\n📧 Notified: {notified}\n"
+NEXT_UPDATE_LINE = f"\n🕒 Next update in {POLL_INTERVAL_SECONDS:g} seconds... (Press Ctrl+C to stop)\n"
+YES_NO = {True: "Yes", False: "No"}
+
+# Simple text-based world map; your own cell never changes
+MAP_WIDTH = 60
+MAP_HEIGHT = 15
+MAP_ROW_TEMPLATE = ["・"] * MAP_WIDTH
+MAP_TITLE = "🌎 Your Position vs ISS Position:\n"
+MY_POSITION_LINE = f"\n\n📍 Your position: {CFG.my_lat}, {CFG.my_lng}\n"
+MY_X_POS = int((CFG.my_lng + 180) / 360 * (MAP_WIDTH - 1))
+MY_Y_POS = int((1 - (CFG.my_lat + 90) / 180) * (MAP_HEIGHT - 1))
 
 SUCCESS_ART = r"""
     🌌
@@ -52,26 +160,47 @@ SUCCESS_ART = r"""
  /     \
 """
 
-def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """Calculate distance between two coordinates using Haversine formula."""
-    R = 6371  # Earth radius in kilometers
-    
-    lat1_rad = math.radians(lat1)
+def _haversine(lat1_rad: float, lng1_rad: float, cos_lat1: float, lat2: float, lng2: float) -> float:
+    """Haversine distance in km from a point given in radians (plus its cosine) to one in degrees."""
     lat2_rad = math.radians(lat2)
-    delta_lat = math.radians(lat2 - lat1)
-    delta_lon = math.radians(lon2 - lon1)
+    delta_lat = lat2_rad - lat1_rad
+    delta_lon = math.radians(lng2) - lng1_rad
+    
+    a = (math.sin(delta_lat/2) ** 2 + 
+         cos_lat1 * math.cos(lat2_rad) * math.sin(delta_lon/2) ** 2)
+    
+    # Clamp to guard asin against rounding just above 1 for antipodal points
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(a, 1.0)))
+
+if njit is not None:
+    _haversine = njit(cache=True, fastmath=True)(_haversine)
+
+# Prefer the Cython kernel when it has been built (cythonize -i fast_haversine.pyx)
+try:
+    from fast_haversine import haversine as _haversine
+except ImportError:
+    pass
+
+def calculate_distance(iss_lat: float, iss_lng: float) -> float:
+    """Calculate distance from your position to the given coordinates using Haversine formula."""
+    return _haversine(CFG.my_lat_rad, CFG.my_lng_rad, CFG.cos_my_lat, iss_lat, iss_lng)
+
+def haversine_np(iss_lats: "np.ndarray", iss_lons: "np.ndarray") -> "np.ndarray":
+    """Calculate distances from your position to arrays of coordinates (e.g. a predicted ground track)."""
+    if np is None:
+        raise ImportError("numpy is required for haversine_np")
     
-    a = (math.sin(delta_lat/2) * math.sin(delta_lat/2) + 
-         math.cos(lat1_rad) * math.cos(lat2_rad) * 
-         math.sin(delta_lon/2) * math.sin(delta_lon/2))
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
+    lats_rad = np.radians(iss_lats)
+    delta_lat = lats_rad - CFG.my_lat_rad
+    delta_lon = np.radians(iss_lons) - CFG.my_lng_rad
     
-    return R * c
+    a = np.sin(delta_lat/2) ** 2 + CFG.cos_my_lat * np.cos(lats_rad) * np.sin(delta_lon/2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
 
 def get_iss_location() -> Tuple[Optional[float], Optional[float]]:
     """Get current ISS coordinates."""
     try:
-        response = requests.get(url="http://api.open-notify.org/iss-now.json", timeout=10)
+        response = CLIENT.get(url="http://api.open-notify.org/iss-now.json")
         response.raise_for_status()
         data = response.json()
         
@@ -80,114 +209,143 @@ def get_iss_location() -> Tuple[Optional[float], Optional[float]]:
         
         return iss_latitude, iss_longitude
             
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         logging.error(f"Error fetching ISS data: {e}")
         return None, None
     except (KeyError, ValueError) as e:
         logging.error(f"Error parsing ISS data: {e}")
         return None, None
 
-def is_iss_overhead() -> Tuple[bool, Optional[float]]:
-    """Check if ISS is overhead and return status with distance."""
-    iss_lat, iss_lng = get_iss_location()
-    
-    if iss_lat is None or iss_lng is None:
-        return False, None
-        
-    # Calculate distance from your position
-    distance = calculate_distance(MY_LAT, MY_LNG, iss_lat, iss_lng)
-    
-    # Check if ISS is within 500km (more precise than 5 degrees)
-    if distance <= 500:
-        logging.info(f"ISS is {distance:.2f} km away")
-        return True, distance
-    else:
-        logging.info(f"ISS is {distance:.2f} km away (too far)")
-        return False, distance
+def local_day(epoch: float) -> int:
+    """Return the number of whole local days since the epoch for the given timestamp."""
+    return int((epoch + CFG.utc_offset_seconds) // SECONDS_PER_DAY)
+
+def format_local_time(epoch: float) -> str:
+    """Format a UTC epoch timestamp as local HH:MM."""
+    return time.strftime('%H:%M', time.gmtime(epoch + CFG.utc_offset_seconds))
 
-def is_night() -> bool:
-    """Check if it's currently night time at your location."""
+def get_sun_times() -> Tuple[Optional[float], Optional[float]]:
+    """Get today's sunrise and sunset as UTC epoch seconds, fetching them at most once a day."""
+    today = local_day(time.time())
+    if _sun_cache["day"] == today:
+        return _sun_cache["sunrise"], _sun_cache["sunset"]
+    
     try:
         parameters = {
-            "lat": MY_LAT,
-            "lng": MY_LNG,
+            "lat": CFG.my_lat,
+            "lng": CFG.my_lng,
+            "date": time.strftime('%Y-%m-%d', time.gmtime(today * SECONDS_PER_DAY)),
             "formatted": 0
         }
         
-        response = requests.get(url="https://api.sunrise-sunset.org/json", 
-                               params=parameters, timeout=10)
+        response = CLIENT.get(url="https://api.sunrise-sunset.org/json", params=parameters)
         response.raise_for_status()
         data = response.json()
         
         if data["status"] != "OK":
-            logging.error(f"Sunrise-sunset API error: {data}")
-            return False
+            raise ValueError(f"Sunrise-sunset API error: {data}")
             
-        sunrise_str = data["results"]["sunrise"]
-        sunset_str = data["results"]["sunset"]
+        # Sunrise and sunset come in UTC; only epoch seconds are kept
+        sunrise = datetime.fromisoformat(data["results"]["sunrise"].replace('Z', '+00:00')).timestamp()
+        sunset = datetime.fromisoformat(data["results"]["sunset"].replace('Z', '+00:00')).timestamp()
         
-        # Parse sunrise and sunset times (they come in UTC)
-        sunrise_utc = datetime.fromisoformat(sunrise_str.replace('Z', '+00:00'))
-        sunset_utc = datetime.fromisoformat(sunset_str.replace('Z', '+00:00'))
+        _sun_cache.update(day=today, sunrise=sunrise, sunset=sunset)
+        return sunrise, sunset
         
-        # Convert to local timezone - remove timezone info to make them naive
-        utc_offset = timedelta(hours=TIMEZONE_OFFSET)
-        sunrise_local = (sunrise_utc + utc_offset).replace(tzinfo=None)
-        sunset_local = (sunset_utc + utc_offset).replace(tzinfo=None)
-        current_time = datetime.now()  # This is timezone-naive
+    except httpx.HTTPError as e:
+        logging.error(f"Error fetching sunrise/sunset data: {e}")
+    except (KeyError, TypeError, ValueError) as e:
+        logging.error(f"Error parsing sunrise/sunset data: {e}")
+    
+    # Fall back to the last known times, shifted forward to today
+    if _sun_cache["day"] is None:
+        return None, None
+    logging.warning("Using cached sunrise/sunset times from an earlier day")
+    shift = (today - _sun_cache["day"]) * SECONDS_PER_DAY
+    return _sun_cache["sunrise"] + shift, _sun_cache["sunset"] + shift
+
+def is_night(sunrise: Optional[float], sunset: Optional[float]) -> bool:
+    """Check if it's currently night time at your location, given today's sun times."""
+    try:
+        if sunrise is None or sunset is None:
+            return False
         
-        # For night detection, handle day crossing correctly
-        if sunrise_local.date() != sunset_local.date():
-            # Handle case where sunset is on different day (shouldn't happen normally)
-            is_dark = current_time.time() > sunset_local.time() or current_time.time() < sunrise_local.time()
-        else:
-            # Normal case: sunrise and sunset on same day
-            if sunrise_local < sunset_local:
-                # Normal day: sunrise before sunset
-                is_dark = current_time.time() < sunrise_local.time() or current_time.time() > sunset_local.time()
-            else:
-                # Edge case: might cross midnight
-                is_dark = current_time.time() > sunset_local.time() or current_time.time() < sunrise_local.time()
+        now = time.time()
+        is_dark = not (sunrise <= now < sunset)
         
-        logging.info(f"Sunset: {sunset_local.strftime('%H:%M')}, Sunrise: {sunrise_local.strftime('%H:%M')}, "
-                    f"Current: {current_time.strftime('%H:%M')}, Is night: {is_dark}")
+        logging.info(f"Sunset: {format_local_time(sunset)}, Sunrise: {format_local_time(sunrise)}, "
+                    f"Current: {format_local_time(now)}, Is night: {is_dark}")
         return is_dark
         
-    except requests.exceptions.RequestException as e:
-        logging.error(f"Error fetching sunrise/sunset data: {e}")
-        return False
-    except (KeyError, ValueError) as e:
-        logging.error(f"Error parsing sunrise/sunset data: {e}")
-        return False
     except Exception as e:
         logging.error(f"Error in night detection: {e}")
         return False
 
+def should_poll_iss(sunrise: Optional[float], sunset: Optional[float]) -> bool:
+    """Check if the ISS position is worth fetching (night, shortly before sunset, or unknown)."""
+    if sunrise is None or sunset is None:
+        return True  # Can't tell day from night, so keep tracking
+    
+    now = time.time()
+    return not (sunrise <= now < sunset - PRE_SUNSET_BUFFER_SECONDS)
+
+def _get_smtp() -> smtplib.SMTP:
+    """Return a logged-in SMTP connection, reusing the previous one while it is still alive."""
+    global _smtp
+    if _smtp is not None:
+        try:
+            _smtp.noop()  # Cheap round trip to detect a connection the server has closed
+            return _smtp
+        except (smtplib.SMTPException, OSError):
+            close_smtp()
+    
+    server = smtplib.SMTP("smtp.gmail.com", 587, timeout=30)
+    try:
+        server.starttls()
+        server.login(CFG.email, CFG.password)
+    except Exception:
+        server.close()
+        raise
+    _smtp = server
+    return _smtp
+
+def close_smtp():
+    """Close the cached SMTP connection, if any."""
+    global _smtp
+    if _smtp is None:
+        return
+    try:
+        _smtp.quit()
+    except (smtplib.SMTPException, OSError):
+        _smtp.close()
+    _smtp = None
+
 def send_email_notification(distance: float):
     """Send email notification about ISS sighting."""
     try:
-        # Create message with proper MIME structure
-        msg = MIMEMultipart()
-        msg['From'] = MY_EMAIL
-        msg['To'] = MY_EMAIL
+        # Plain-text message; no multipart container needed
+        msg = EmailMessage()
+        msg['From'] = CFG.email
+        msg['To'] = CFG.email
         msg['Subject'] = "🌌 ISS Overhead! Look Up! 🌌"
         
         body = (
             f"The International Space Station is {distance:.2f} km above you!\n"
             f"Go outside and look up! You might see it passing by!\n\n"
             f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-            f"Position: {MY_LAT}, {MY_LNG}"
+            f"Position: {CFG.my_lat}, {CFG.my_lng}"
         )
         
-        msg.attach(MIMEText(body, 'plain'))
+        msg.set_content(body)
         
-        # Send email
-        with smtplib.SMTP("smtp.gmail.com", 587) as server:
-            server.starttls()
-            server.login(MY_EMAIL, EMAIL_PASSWORD)
-            server.send_message(msg)
+        # Send email over the cached connection, reconnecting once if the server dropped it
+        try:
+            _get_smtp().send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            close_smtp()
+            _get_smtp().send_message(msg)
             
-        logging.info(f"Email sent successfully to {MY_EMAIL}")
+        logging.info(f"Email sent successfully to {CFG.email}")
         print(SUCCESS_ART)
         
     except smtplib.SMTPAuthenticationError:
@@ -197,48 +355,25 @@ def send_email_notification(distance: float):
     except Exception as e:
         logging.error(f"Failed to send email: {e}")
 
-def display_iss_position(iss_lat: float, iss_lng: float, distance: float):
-    """Display a visual representation of ISS position relative to user."""
-    # Simple text-based visualization
-    map_width = 60
-    map_height = 15
-    
+def render_iss_position(iss_lat: float, iss_lng: float, distance: float) -> str:
+    """Render a visual representation of ISS position relative to user."""
     # Calculate relative position (normalized)
     lat_ratio = (iss_lat + 90) / 180  # Convert from [-90,90] to [0,1]
     lng_ratio = (iss_lng + 180) / 360  # Convert from [-180,180] to [0,1]
     
     # Scale to map size
-    x_pos = int(lng_ratio * (map_width - 1))  # Prevent index out of bounds
-    y_pos = int((1 - lat_ratio) * (map_height - 1))  # Invert y-axis for display
-    
-    # Calculate your position on the map
-    my_lat_ratio = (MY_LAT + 90) / 180
-    my_lng_ratio = (MY_LNG + 180) / 360
-    my_x_pos = int(my_lng_ratio * (map_width - 1))
-    my_y_pos = int((1 - my_lat_ratio) * (map_height - 1))
-    
-    print("🌎 Your Position vs ISS Position:")
-    for y in range(map_height):
-        row = ""
-        for x in range(map_width):
-            if x == my_x_pos and y == my_y_pos:
-                row += "🏠"  # Your position
-            elif x == x_pos and y == y_pos:
-                row += "🛰️"  # ISS position
-            elif x == my_x_pos and y == my_y_pos and x == x_pos and y == y_pos:
-                row += "🎯"  # Both at same position (unlikely but possible)
-            else:
-                row += "・"
-        print(row)
+    x_pos = int(lng_ratio * (MAP_WIDTH - 1))  # Prevent index out of bounds
+    y_pos = int((1 - lat_ratio) * (MAP_HEIGHT - 1))  # Invert y-axis for display
     
-    print(f"\n📍 Your position: {MY_LAT}, {MY_LNG}")
-    print(f"🛰️  ISS position: {iss_lat:.2f}, {iss_lng:.2f}")
-    print(f"📏 Distance: {distance:.2f} km")
+    # Start from a blank grid and mark only the two occupied cells
+    grid = [MAP_ROW_TEMPLATE.copy() for _ in range(MAP_HEIGHT)]
+    grid[y_pos][x_pos] = "🛰️"  # ISS position
+    grid[MY_Y_POS][MY_X_POS] = "🏠"  # Your position (drawn last so it wins a shared cell)
     
     # Add direction information
     direction = ""
-    lat_diff = iss_lat - MY_LAT
-    lng_diff = iss_lng - MY_LNG
+    lat_diff = iss_lat - CFG.my_lat
+    lng_diff = iss_lng - CFG.my_lng
     
     if abs(lat_diff) > 0.1:  # Small threshold to avoid noise
         if lat_diff > 0:
@@ -256,33 +391,36 @@ def display_iss_position(iss_lat: float, iss_lng: float, distance: float):
     
     if not direction:
         direction = "Directly overhead"
-        
-    print(f"🧭 Direction: {direction}")
+    
+    return "".join((
+        MAP_TITLE,
+        "\n".join("".join(row) for row in grid),
+        MY_POSITION_LINE,
+        f"🛰️  ISS position: {iss_lat:.2f}, {iss_lng:.2f}\n",
+        f"📏 Distance: {distance:.2f} km\n",
+        f"🧭 Direction: {direction}\n",
+    ))
 
 def validate_config():
-    """Validate configuration settings."""
-    errors = []
-    
-    if MY_EMAIL == "your_email@gmail.com":
-        errors.append("Please set your email address in the .env file")
-    
-    if EMAIL_PASSWORD == "your_app_password":
-        errors.append("Please set your email app password in the .env file")
-    
-    if not (-90 <= MY_LAT <= 90):
-        errors.append(f"Invalid latitude: {MY_LAT}. Must be between -90 and 90")
-    
-    if not (-180 <= MY_LNG <= 180):
-        errors.append(f"Invalid longitude: {MY_LNG}. Must be between -180 and 180")
-    
-    if errors:
-        for error in errors:
+    """Report configuration errors found when the config was loaded."""
+    if CFG.errors:
+        for error in CFG.errors:
             logging.error(error)
             print(f"❌ {error}")
         return False
     
     return True
 
+def wait_for_next_tick(next_tick: float) -> float:
+    """Sleep until the next poll deadline on a fixed cadence and return that deadline."""
+    next_tick += POLL_INTERVAL_SECONDS
+    delay = next_tick - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+    else:
+        next_tick = time.monotonic()  # Overran a tick; resync instead of bursting to catch up
+    return next_tick
+
 def main():
     """Main monitoring function."""
     print(BANNER)
@@ -298,40 +436,48 @@ def main():
     already_notified = False
     consecutive_errors = 0
     max_consecutive_errors = 5
+    next_tick = time.monotonic()
     
     while True:
         try:
-            iss_lat, iss_lng = get_iss_location()
-            if iss_lat is None or iss_lng is None:
-                consecutive_errors += 1
-                print(f"❌ Failed to get ISS location (attempt {consecutive_errors}/{max_consecutive_errors}). Retrying in 60 seconds...")
-                if consecutive_errors >= max_consecutive_errors:
-                    logging.error("Too many consecutive errors. Stopping.")
-                    break
-                time.sleep(60)
-                continue
-            else:
-                consecutive_errors = 0  # Reset error counter on success
-                
-            distance = calculate_distance(MY_LAT, MY_LNG, iss_lat, iss_lng)
-            iss_overhead = distance <= 500
-            night_time = is_night()
+            # Sun times are cached for the day, so check them before touching the ISS API
+            sunrise, sunset = get_sun_times()
+            night_time = is_night(sunrise, sunset)
+            polling = should_poll_iss(sunrise, sunset)
             
-            # Clear console and display updated information
-            try:
-                os.system('cls' if os.name == 'nt' else 'clear')
-            except:
-                pass  # Don't crash if clear doesn't work
-                
-            print(BANNER)
-            
-            # Display ISS position visualization
-            display_iss_position(iss_lat, iss_lng, distance)
+            if polling:
+                iss_lat, iss_lng = get_iss_location()
+                if iss_lat is None or iss_lng is None:
+                    consecutive_errors += 1
+                    print(f"❌ Failed to get ISS location (attempt {consecutive_errors}/{max_consecutive_errors}). Retrying in {POLL_INTERVAL_SECONDS:g} seconds...")
+                    if consecutive_errors >= max_consecutive_errors:
+                        logging.error("Too many consecutive errors. Stopping.")
+                        break
+                    next_tick = wait_for_next_tick(next_tick)
+                    continue
+                else:
+                    consecutive_errors = 0  # Reset error counter on success
+                    
+                distance = calculate_distance(iss_lat, iss_lng)
+                iss_overhead = distance <= OVERHEAD_RADIUS_KM  # Reuse the distance already computed for display
+                logging.info(f"ISS is {distance:.2f} km away{'' if iss_overhead else ' (too far)'}")
+            else:
+                iss_overhead = False
             
-            # Display conditions
-            print(f"\n🌙 Night time: {'Yes' if night_time else 'No'}")
-            print(f"🛰️  ISS overhead: {'Yes' if iss_overhead else 'No'}")
-            print(f"📧 Notified: {'Yes' if already_notified else 'No'}")
+            # Build the whole frame (clear screen included) and write it in one go
+            parts = [FRAME_HEADER]
+            if polling:
+                parts.append(render_iss_position(iss_lat, iss_lng, distance))
+            else:
+                parts.append(DAYTIME_STATUS)
+            parts.append(STATUS_TEMPLATE.format_map({
+                "night": YES_NO[night_time],
+                "overhead": YES_NO[iss_overhead],
+                "notified": YES_NO[already_notified],
+            }))
+            parts.append(NEXT_UPDATE_LINE)
+            sys.stdout.write("".join(parts))
+            sys.stdout.flush()
             
             if iss_overhead and night_time and not already_notified:
                 logging.info("ISS is overhead and it's night time!")
@@ -343,8 +489,7 @@ def main():
                 logging.info("Reset notification flag")
             
             # Wait before checking again
-            print(f"\n🕒 Next update in 60 seconds... (Press Ctrl+C to stop)")
-            time.sleep(60)
+            next_tick = wait_for_next_tick(next_tick)
             
         except KeyboardInterrupt:
             logging.info("Program stopped by user")
@@ -356,7 +501,10 @@ def main():
             if consecutive_errors >= max_consecutive_errors:
                 logging.error("Too many consecutive errors. Stopping.")
                 break
-            time.sleep(60)  # Wait before retrying after error
+            next_tick = wait_for_next_tick(next_tick)  # Wait before retrying after error
+    
+    close_smtp()
+    CLIENT.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file